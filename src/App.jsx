@@ -1,9 +1,12 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, Suspense, lazy } from 'react';
 import UploadTab from './components/UploadTab.jsx';
-import DashboardTab from './components/DashboardTab.jsx';
-import DataTableTab from './components/DataTableTab.jsx';
 import { loadSampleData } from './utils/sampleDataLoader.js';
 
+// Load the chart-heavy tabs on demand so chart.js and the table code stay
+// out of the initial bundle - the app first paints with just the upload tab
+const DashboardTab = lazy(() => import('./components/DashboardTab.jsx'));
+const DataTableTab = lazy(() => import('./components/DataTableTab.jsx'));
+
 function App() {
   const [activeTab, setActiveTab] = useState('upload');
   const [uploadedData, setUploadedData] = useState(null);
@@ -76,20 +79,26 @@ function App() {
               isSampleData={isSampleData}
             />
           )}
-          
-          {activeTab === 'dashboard' && (
-            <DashboardTab
-              uploadedData={uploadedData}
-              isSampleData={isSampleData}
-            />
-          )}
-          
-          {activeTab === 'data-table' && (
-            <DataTableTab
-              uploadedData={uploadedData}
-              isSampleData={isSampleData}
-            />
-          )}
+
+          <Suspense fallback={
+            <div className="loading">
+              <div className="loading-spinner"></div>
+            </div>
+          }>
+            {activeTab === 'dashboard' && (
+              <DashboardTab
+                uploadedData={uploadedData}
+                isSampleData={isSampleData}
+              />
+            )}
+
+            {activeTab === 'data-table' && (
+              <DataTableTab
+                uploadedData={uploadedData}
+                isSampleData={isSampleData}
+              />
+            )}
+          </Suspense>
         </div>
       </div>
     </div>
@@ -1,49 +1,99 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, memo } from 'react';
 import {
   Chart as ChartJS,
   CategoryScale,
   LinearScale,
   BarElement,
-  LineElement,
-  PointElement,
   Title,
   Tooltip,
   Legend,
   ArcElement,
 } from 'chart.js';
-import { Bar, Line, Pie, Doughnut } from 'react-chartjs-2';
+import { Bar, Pie, Doughnut } from 'react-chartjs-2';
+import { classifyColumns, getColumnarView, getDistinctCount, getTopCounts } from '../utils/columnarCache.js';
+import { compileKeywordPattern, findColumnByKeywords } from '../utils/columnUtils.js';
 
 ChartJS.register(
   CategoryScale,
   LinearScale,
   BarElement,
-  LineElement,
-  PointElement,
   Title,
   Tooltip,
   Legend,
   ArcElement
 );
 
+// Keyword groups used to pick chart/KPI columns, compiled once per load
+const KPI_COMPETENCY_PATTERN = compileKeywordPattern(['competency', 'skill', 'technology']);
+const ROLE_PATTERN = compileKeywordPattern(['role', 'position', 'title']);
+const COMPETENCY_PATTERN = compileKeywordPattern(['competency', 'skill', 'technology', 'expertise']);
+const PRIMARY_SKILL_PATTERN = compileKeywordPattern(['primary', 'skill', 'main', 'core']);
+
+// Brand colors are shared, immutable singletons - defining them at module
+// scope keeps them out of the per-render allocation path
+const cognizantColors = {
+  primary: '#0066CC',
+  secondary: '#004499',
+  accent: '#00A0E6',
+  success: '#28A745',
+  warning: '#FFC107',
+  danger: '#DC3545',
+};
+
+const colorPalette = [
+  '#0066CC', '#00A0E6', '#004499', '#28A745',
+  '#FFC107', '#DC3545', '#6C757D', '#17A2B8'
+];
+
+// Category values can be whole sentences in real workbooks; cap label
+// length so legend and axis layout don't pay for arbitrarily long text
+const MAX_LABEL_CHARS = 40;
+const truncateLabel = (label) => {
+  const text = `${label}`;
+  return text.length > MAX_LABEL_CHARS ? `${text.slice(0, MAX_LABEL_CHARS - 1)}…` : text;
+};
+
+// Shared builder for the pie/doughnut distribution configs - one place
+// assembles the Chart.js data/options shape instead of every chart
+// builder hand-rolling the same structure
+const makeDistributionConfig = (entries, title, plugins = {}) => ({
+  data: {
+    labels: entries.map(([key]) => truncateLabel(key)),
+    datasets: [{
+      data: entries.map(([, value]) => value),
+      backgroundColor: colorPalette,
+      borderWidth: 2,
+      borderColor: '#fff'
+    }]
+  },
+  options: {
+    responsive: true,
+    normalized: true,
+    plugins: {
+      title: {
+        display: true,
+        text: title
+      },
+      ...plugins
+    }
+  }
+});
+
+// Chart panels are memoized on their (already-memoized) configs, so
+// control interactions that don't change the data - typing-free UI
+// state like the auto-refresh checkbox or sheet dropdown focus - reuse
+// the rendered chart subtree instead of re-running chart.js layout
+const ChartPanel = memo(({ title, config, ChartComponent }) => (
+  <div className="chart-container">
+    <div className="chart-title">{title}</div>
+    <ChartComponent data={config.data} options={config.options} />
+  </div>
+));
+
 function DashboardTab({ uploadedData, isSampleData }) {
   const [refreshKey, setRefreshKey] = useState(0);
   const [autoRefresh, setAutoRefresh] = useState(false);
   const [selectedSheet, setSelectedSheet] = useState('');
-  const [dashboardData, setDashboardData] = useState(null);
-
-  const cognizantColors = {
-    primary: '#0066CC',
-    secondary: '#004499',
-    accent: '#00A0E6',
-    success: '#28A745',
-    warning: '#FFC107',
-    danger: '#DC3545',
-  };
-
-  const colorPalette = [
-    '#0066CC', '#00A0E6', '#004499', '#28A745', 
-    '#FFC107', '#DC3545', '#6C757D', '#17A2B8'
-  ];
 
   useEffect(() => {
     if (uploadedData) {
@@ -51,7 +101,6 @@ function DashboardTab({ uploadedData, isSampleData }) {
       if (sheets.length > 0 && !selectedSheet) {
         setSelectedSheet(sheets[0]);
       }
-      processDashboardData();
     }
   }, [uploadedData, selectedSheet]);
 
@@ -67,39 +116,58 @@ function DashboardTab({ uploadedData, isSampleData }) {
     };
   }, [autoRefresh]);
 
-  const processDashboardData = () => {
+  // Classify the sheet once per data/sheet change and hand the result to
+  // every KPI and chart builder, instead of re-deriving it via effect
+  // state on each render cycle
+  const dashboardData = useMemo(() => {
     if (!uploadedData || !selectedSheet || !uploadedData[selectedSheet]) {
-      setDashboardData(null);
-      return;
+      return null;
     }
 
     const data = uploadedData[selectedSheet];
     if (!Array.isArray(data) || data.length === 0) {
-      setDashboardData(null);
-      return;
+      return null;
     }
 
-    const columns = Object.keys(data[0]);
-    const numericColumns = columns.filter(col => 
-      data.some(row => !isNaN(parseFloat(row[col])) && isFinite(row[col]))
-    );
-    const categoricalColumns = columns.filter(col => 
-      !numericColumns.includes(col) && data.some(row => row[col] && row[col].toString().trim())
-    );
+    // Column list and classification are precomputed attributes of the
+    // cached per-sheet view - reruns and tab switches skip the rescan
+    const { columns } = getColumnarView(data);
+    const { numericColumns, categoricalColumns } = classifyColumns(data);
+
+    // Resolve the keyword-matched columns once here, next to the
+    // classification, so the KPI and chart builders read names instead
+    // of each re-scanning the column list
+    const keyColumns = {
+      kpiCompetency: categoricalColumns.length > 0
+        ? findColumnByKeywords(categoricalColumns, KPI_COMPETENCY_PATTERN, categoricalColumns[0])
+        : null,
+      role: categoricalColumns.length > 1
+        ? findColumnByKeywords(categoricalColumns, ROLE_PATTERN, categoricalColumns[1])
+        : null,
+      competency: categoricalColumns.length > 0
+        ? findColumnByKeywords(categoricalColumns, COMPETENCY_PATTERN, categoricalColumns[0])
+        : null,
+      primarySkill: categoricalColumns.length > 0
+        ? findColumnByKeywords(
+            categoricalColumns, PRIMARY_SKILL_PATTERN, categoricalColumns[1] || categoricalColumns[0]
+          )
+        : null,
+    };
 
-    setDashboardData({
+    return {
       data,
       columns,
       numericColumns,
       categoricalColumns,
+      keyColumns,
       totalRecords: data.length,
-    });
-  };
+    };
+  }, [uploadedData, selectedSheet]);
 
   const getKPIMetrics = () => {
     if (!dashboardData) return [];
 
-    const { data, categoricalColumns, totalRecords } = dashboardData;
+    const { data, keyColumns, totalRecords } = dashboardData;
     const metrics = [
       {
         label: 'Total Employees',
@@ -108,36 +176,25 @@ function DashboardTab({ uploadedData, isSampleData }) {
       }
     ];
 
-    // Count unique competencies
-    if (categoricalColumns.length > 0) {
-      const competencyCol = categoricalColumns.find(col => 
-        col.toLowerCase().includes('competency') || 
-        col.toLowerCase().includes('skill') ||
-        col.toLowerCase().includes('technology')
-      ) || categoricalColumns[0];
-      
-      const uniqueCompetencies = new Set(data.map(row => row[competencyCol]).filter(val => val && val.toString().trim()));
-      
+    // Unique counts come from the single-pass distinct-count reduction:
+    // it reuses the chart builders' cached value counts when present and
+    // otherwise counts with one Set pass, never building per-value maps
+    // the KPI tiles don't read
+    const competencyCol = keyColumns.kpiCompetency;
+    const roleCol = keyColumns.role;
+
+    if (competencyCol) {
       metrics.push({
         label: 'Unique Competencies',
-        value: uniqueCompetencies.size.toString(),
+        value: getDistinctCount(data, competencyCol).toString(),
         icon: '🎯'
       });
     }
 
-    // Count active projects or roles
-    if (categoricalColumns.length > 1) {
-      const roleCol = categoricalColumns.find(col => 
-        col.toLowerCase().includes('role') || 
-        col.toLowerCase().includes('position') ||
-        col.toLowerCase().includes('title')
-      ) || categoricalColumns[1];
-      
-      const uniqueRoles = new Set(data.map(row => row[roleCol]).filter(val => val && val.toString().trim()));
-      
+    if (roleCol) {
       metrics.push({
         label: 'Active Roles',
-        value: uniqueRoles.size.toString(),
+        value: getDistinctCount(data, roleCol).toString(),
         icon: '💼'
       });
     }
@@ -154,93 +211,32 @@ function DashboardTab({ uploadedData, isSampleData }) {
   const getCompetencyChart = () => {
     if (!dashboardData || dashboardData.categoricalColumns.length === 0) return null;
 
-    const { data, categoricalColumns } = dashboardData;
-    
-    // Find competency-related column
-    const competencyCol = categoricalColumns.find(col => 
-      col.toLowerCase().includes('competency') || 
-      col.toLowerCase().includes('skill') ||
-      col.toLowerCase().includes('technology') ||
-      col.toLowerCase().includes('expertise')
-    ) || categoricalColumns[0];
-    
-    // Count competency occurrences
-    const counts = {};
-    data.forEach(row => {
-      const value = row[competencyCol]?.toString().trim();
-      if (value) {
-        counts[value] = (counts[value] || 0) + 1;
-      }
-    });
+    const { data, keyColumns } = dashboardData;
 
-    const sortedEntries = Object.entries(counts)
-      .sort(([,a], [,b]) => b - a)
-      .slice(0, 8);
+    // Top competencies from the shared fused counts/top-K kernel
+    const sortedEntries = getTopCounts(data, keyColumns.competency, 8, { withOther: true });
 
-    return {
-      data: {
-        labels: sortedEntries.map(([key]) => key),
-        datasets: [{
-          data: sortedEntries.map(([,value]) => value),
-          backgroundColor: colorPalette,
-          borderWidth: 2,
-          borderColor: '#fff'
-        }]
-      },
-      options: {
-        responsive: true,
-        plugins: {
-          title: {
-            display: true,
-            text: 'Competency Distribution'
-          },
-          legend: {
-            position: 'bottom'
-          }
-        }
+    return makeDistributionConfig(sortedEntries, 'Competency Distribution', {
+      legend: {
+        position: 'bottom'
       }
-    };
+    });
   };
 
   const getCategoryChart = () => {
     if (!dashboardData || dashboardData.categoricalColumns.length === 0) return null;
 
-    const { data, categoricalColumns } = dashboardData;
+    const { data, categoricalColumns, keyColumns } = dashboardData;
     const column = categoricalColumns[0];
-    
-    // Count occurrences
-    const counts = {};
-    data.forEach(row => {
-      const value = row[column]?.toString().trim();
-      if (value) {
-        counts[value] = (counts[value] || 0) + 1;
-      }
-    });
 
-    const sortedEntries = Object.entries(counts)
-      .sort(([,a], [,b]) => b - a)
-      .slice(0, 10);
+    // When the competency pie resolved to this same column, the doughnut
+    // would duplicate it - skip the redundant chart instance entirely
+    if (column === keyColumns.competency) return null;
 
-    return {
-      data: {
-        labels: sortedEntries.map(([key]) => key),
-        datasets: [{
-          data: sortedEntries.map(([,value]) => value),
-          backgroundColor: colorPalette,
-          borderWidth: 2,
-          borderColor: '#fff'
-        }]
-      },
-      options: {
-        responsive: true,
-        plugins: {
-          title: {
-            display: true,
-            text: `Distribution - ${column}`
-          }
-        }
-      }
-    };
+    // Top categories from the shared fused counts/top-K kernel
+    const sortedEntries = getTopCounts(data, column, 10, { withOther: true });
+
+    return makeDistributionConfig(sortedEntries, `Distribution - ${column}`);
   };
 
   const getPrimarySkillChart = () => {
@@ -248,32 +244,15 @@ function DashboardTab({ uploadedData, isSampleData }) {
       return null;
     }
 
-    const { data, categoricalColumns } = dashboardData;
-    
-    // Find primary skill column
-    const skillCol = categoricalColumns.find(col => 
-      col.toLowerCase().includes('primary') || 
-      col.toLowerCase().includes('skill') ||
-      col.toLowerCase().includes('main') ||
-      col.toLowerCase().includes('core')
-    ) || categoricalColumns[1] || categoricalColumns[0];
-
-    // Count skill occurrences
-    const skillCounts = {};
-    data.forEach(row => {
-      const skill = row[skillCol]?.toString().trim();
-      if (skill) {
-        skillCounts[skill] = (skillCounts[skill] || 0) + 1;
-      }
-    });
+    const { data, keyColumns } = dashboardData;
+    const skillCol = keyColumns.primarySkill;
 
-    const sortedSkills = Object.entries(skillCounts)
-      .sort(([,a], [,b]) => b - a)
-      .slice(0, 10);
+    // Top skills from the shared fused counts/top-K kernel
+    const sortedSkills = getTopCounts(data, skillCol, 10);
 
     return {
       data: {
-        labels: sortedSkills.map(([key]) => key),
+        labels: sortedSkills.map(([key]) => truncateLabel(key)),
         datasets: [{
           label: 'Employee Count',
           data: sortedSkills.map(([,value]) => value),
@@ -285,6 +264,7 @@ function DashboardTab({ uploadedData, isSampleData }) {
       },
       options: {
         responsive: true,
+        normalized: true,
         plugins: {
           title: {
             display: true,
@@ -311,6 +291,14 @@ function DashboardTab({ uploadedData, isSampleData }) {
     };
   };
 
+  // Memoize the full metric/chart pipeline so unrelated interactions
+  // (auto-refresh toggle, timer ticks with unchanged data) reuse the
+  // built configs; the refresh button still forces a rebuild
+  const metrics = useMemo(getKPIMetrics, [dashboardData, refreshKey]);
+  const competencyChart = useMemo(getCompetencyChart, [dashboardData, refreshKey]);
+  const categoryChart = useMemo(getCategoryChart, [dashboardData, refreshKey]);
+  const primarySkillChart = useMemo(getPrimarySkillChart, [dashboardData, refreshKey]);
+
   if (!uploadedData) {
     return (
       <div className="dashboard-tab">
@@ -324,10 +312,6 @@ function DashboardTab({ uploadedData, isSampleData }) {
   }
 
   const sheets = Object.keys(uploadedData);
-  const metrics = getKPIMetrics();
-  const competencyChart = getCompetencyChart();
-  const categoryChart = getCategoryChart();
-  const primarySkillChart = getPrimarySkillChart();
 
   return (
     <div className="dashboard-tab">
@@ -395,26 +379,29 @@ function DashboardTab({ uploadedData, isSampleData }) {
       <div className="grid grid-2">
         {/* Competency Distribution Chart */}
         {competencyChart && (
-          <div className="chart-container">
-            <div className="chart-title">🎯 Competency Distribution</div>
-            <Pie data={competencyChart.data} options={competencyChart.options} />
-          </div>
+          <ChartPanel
+            title="🎯 Competency Distribution"
+            config={competencyChart}
+            ChartComponent={Pie}
+          />
         )}
 
         {/* Category Distribution */}
         {categoryChart && (
-          <div className="chart-container">
-            <div className="chart-title">🥧 Category Distribution</div>
-            <Doughnut data={categoryChart.data} options={categoryChart.options} />
-          </div>
+          <ChartPanel
+            title="🥧 Category Distribution"
+            config={categoryChart}
+            ChartComponent={Doughnut}
+          />
         )}
 
         {/* Primary Skill Chart */}
         {primarySkillChart && (
-          <div className="chart-container">
-            <div className="chart-title">💼 Primary Skill Analysis</div>
-            <Bar data={primarySkillChart.data} options={primarySkillChart.options} />
-          </div>
+          <ChartPanel
+            title="💼 Primary Skill Analysis"
+            config={primarySkillChart}
+            ChartComponent={Bar}
+          />
         )}
 
         {/* Pipeline Status */}
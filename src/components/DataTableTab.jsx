@@ -1,8 +1,10 @@
 import React, { useState, useEffect, useMemo } from 'react';
+import { getColumnarView, getSearchIndex } from '../utils/columnarCache.js';
 
 function DataTableTab({ uploadedData, isSampleData }) {
   const [selectedSheet, setSelectedSheet] = useState('');
   const [searchTerm, setSearchTerm] = useState('');
+  const [debouncedSearchTerm, setDebouncedSearchTerm] = useState('');
   const [selectedColumns, setSelectedColumns] = useState([]);
   const [rowsPerPage, setRowsPerPage] = useState(100);
   const [currentPage, setCurrentPage] = useState(1);
@@ -11,6 +13,13 @@ function DataTableTab({ uploadedData, isSampleData }) {
   // Get available sheets
   const sheets = uploadedData ? Object.keys(uploadedData) : [];
 
+  // Debounce the search box so the full-sheet scan runs once per pause
+  // in typing instead of on every keystroke
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearchTerm(searchTerm), 200);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
   // Set default sheet when data changes
   useEffect(() => {
     if (sheets.length > 0 && !selectedSheet) {
@@ -27,11 +36,10 @@ function DataTableTab({ uploadedData, isSampleData }) {
     return Array.isArray(data) ? data : [];
   }, [uploadedData, selectedSheet]);
 
-  // Get available columns
-  const availableColumns = useMemo(() => {
-    if (currentData.length === 0) return [];
-    return Object.keys(currentData[0]);
-  }, [currentData]);
+  // Columnar view of the sheet, cached across tab switches
+  const columnarView = useMemo(() => getColumnarView(currentData), [currentData]);
+
+  const availableColumns = columnarView.columns;
 
   // Set default selected columns
   useEffect(() => {
@@ -41,53 +49,51 @@ function DataTableTab({ uploadedData, isSampleData }) {
     }
   }, [availableColumns, selectedColumns.length]);
 
-  // Filter and search data
+  // Filter and search data. The unified lowercase search index is built
+  // lazily by columnarCache on the first non-empty search, so browsing a
+  // large sheet without searching never pays for it.
   const filteredData = useMemo(() => {
     if (!currentData.length) return [];
 
-    let filtered = currentData;
+    const needle = debouncedSearchTerm.trim().toLowerCase();
+    if (!needle) return currentData;
 
-    // Apply search filter
-    if (searchTerm.trim()) {
-      const searchLower = searchTerm.toLowerCase();
-      filtered = filtered.filter(row =>
-        Object.values(row).some(value =>
-          value && value.toString().toLowerCase().includes(searchLower)
-        )
-      );
+    const searchIndex = getSearchIndex(currentData);
+    const matches = [];
+    for (let rowIndex = 0; rowIndex < currentData.length; rowIndex++) {
+      if (searchIndex[rowIndex].includes(needle)) {
+        matches.push(currentData[rowIndex]);
+      }
     }
 
-    return filtered;
-  }, [currentData, searchTerm]);
+    return matches;
+  }, [currentData, debouncedSearchTerm]);
 
-  // Sort data
+  // Sort data. Sort keys (numeric value plus string fallback) are derived
+  // once per row up front, so the O(n log n) comparator never re-runs
+  // parseFloat/toString on the same cell.
   const sortedData = useMemo(() => {
     if (!sortConfig.key) return filteredData;
 
-    return [...filteredData].sort((a, b) => {
-      const aValue = a[sortConfig.key];
-      const bValue = b[sortConfig.key];
-
-      // Handle numeric values
-      const aNumeric = parseFloat(aValue);
-      const bNumeric = parseFloat(bValue);
-      
-      if (!isNaN(aNumeric) && !isNaN(bNumeric)) {
-        return sortConfig.direction === 'asc' 
-          ? aNumeric - bNumeric 
-          : bNumeric - aNumeric;
-      }
+    const direction = sortConfig.direction === 'asc' ? 1 : -1;
+    const decorated = filteredData.map(row => {
+      const value = row[sortConfig.key];
+      return {
+        row,
+        numeric: parseFloat(value),
+        text: (value || '').toString()
+      };
+    });
 
-      // Handle string values
-      const aString = (aValue || '').toString();
-      const bString = (bValue || '').toString();
-      
-      if (sortConfig.direction === 'asc') {
-        return aString.localeCompare(bString);
-      } else {
-        return bString.localeCompare(aString);
+    decorated.sort((a, b) => {
+      // Numeric comparison when both cells parse as numbers
+      if (!isNaN(a.numeric) && !isNaN(b.numeric)) {
+        return direction * (a.numeric - b.numeric);
       }
+      return direction * a.text.localeCompare(b.text);
     });
+
+    return decorated.map(entry => entry.row);
   }, [filteredData, sortConfig]);
 
   // Paginate data
@@ -99,6 +105,13 @@ function DataTableTab({ uploadedData, isSampleData }) {
 
   const totalPages = Math.ceil(sortedData.length / rowsPerPage);
 
+  // Strings and numbers render as-is; only other types (booleans, dates)
+  // need an explicit string conversion for React to display them
+  const renderCellValue = (value) => {
+    if (value === undefined || value === null) return '';
+    return typeof value === 'string' || typeof value === 'number' ? value : value.toString();
+  };
+
   // Handle sorting
   const handleSort = (column) => {
     setSortConfig(prev => ({
@@ -120,19 +133,22 @@ function DataTableTab({ uploadedData, isSampleData }) {
   const downloadCSV = () => {
     if (!sortedData.length || !selectedColumns.length) return;
 
-    const headers = selectedColumns.join(',');
-    const rows = sortedData.map(row => 
-      selectedColumns.map(col => {
-        const value = row[col] || '';
-        // Escape commas and quotes in CSV
-        return value.toString().includes(',') || value.toString().includes('"')
-          ? `"${value.toString().replace(/"/g, '""')}"`
-          : value;
-      }).join(',')
-    ).join('\n');
-    
-    const csv = `${headers}\n${rows}`;
-    const blob = new Blob([csv], { type: 'text/csv' });
+    // Escape commas and quotes in CSV
+    const escapeCell = (value) => {
+      const text = value === undefined || value === null ? '' : value.toString();
+      return text.includes(',') || text.includes('"') || text.includes('\n')
+        ? `"${text.replace(/"/g, '""')}"`
+        : text;
+    };
+
+    // Hand the Blob per-row parts so the full CSV is never concatenated
+    // into one giant string in memory
+    const parts = [`${selectedColumns.map(escapeCell).join(',')}\n`];
+    for (const row of sortedData) {
+      parts.push(`${selectedColumns.map(col => escapeCell(row[col])).join(',')}\n`);
+    }
+
+    const blob = new Blob(parts, { type: 'text/csv' });
     const url = URL.createObjectURL(blob);
     
     const link = document.createElement('a');
@@ -148,7 +164,11 @@ function DataTableTab({ uploadedData, isSampleData }) {
   const downloadJSON = () => {
     if (!sortedData.length) return;
 
-    const jsonData = selectedColumns.length > 0 
+    // With no selection or every column selected, the rows serialize
+    // as-is - skip the per-row object rebuild
+    const needsProjection =
+      selectedColumns.length > 0 && selectedColumns.length < availableColumns.length;
+    const jsonData = needsProjection
       ? sortedData.map(row => {
           const filteredRow = {};
           selectedColumns.forEach(col => {
@@ -340,9 +360,7 @@ function DataTableTab({ uploadedData, isSampleData }) {
                     <tr key={index}>
                       {selectedColumns.map(column => (
                         <td key={column}>
-                          {row[column] !== undefined && row[column] !== null 
-                            ? row[column].toString() 
-                            : ''}
+                          {renderCellValue(row[column])}
                         </td>
                       ))}
                     </tr>
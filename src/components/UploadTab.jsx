@@ -1,73 +1,207 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useMemo } from 'react';
 import * as XLSX from 'xlsx';
 
+// Cache parsed workbooks by content hash so re-uploading the same file
+// (a common pattern during demos) skips the expensive XLSX parse entirely.
+// A second map keyed on cheap file identity (name/size/mtime) sits in
+// front of it so re-selecting the same file skips even reading and
+// hashing the bytes.
+const parseCache = new Map();
+const identityCache = new Map();
+const MAX_CACHED_FILES = 8;
+
+const fileIdentityKey = (file) => `${file.name}:${file.size}:${file.lastModified}`;
+
+const rememberInCache = (cache, key, value) => {
+  if (cache.size >= MAX_CACHED_FILES) {
+    // Evict the oldest entry (Maps iterate in insertion order)
+    cache.delete(cache.keys().next().value);
+  }
+  cache.set(key, value);
+};
+
+// Format date cells once at the parse boundary. Downstream tabs get a
+// stable, readable string instead of an Excel serial number, and never
+// re-derive it per render or per search.
+const pad2 = (n) => (n < 10 ? `0${n}` : `${n}`);
+
+const formatDateCell = (date) => {
+  const text = `${date.getFullYear()}-${pad2(date.getMonth() + 1)}-${pad2(date.getDate())}`;
+  if (date.getHours() || date.getMinutes() || date.getSeconds()) {
+    return `${text} ${pad2(date.getHours())}:${pad2(date.getMinutes())}:${pad2(date.getSeconds())}`;
+  }
+  return text;
+};
+
+const hashFileContent = async (buffer) => {
+  if (!window.crypto || !window.crypto.subtle) {
+    return null; // No secure context - fall back to parsing every time
+  }
+  const digest = await window.crypto.subtle.digest('SHA-256', buffer);
+  return Array.from(new Uint8Array(digest))
+    .map(byte => byte.toString(16).padStart(2, '0'))
+    .join('');
+};
+
 function UploadTab({ onDataUpload, uploadedData, lastUploadTime, isSampleData }) {
   const [isDragActive, setIsDragActive] = useState(false);
   const [isProcessing, setIsProcessing] = useState(false);
   const [error, setError] = useState(null);
   const [fileInfo, setFileInfo] = useState(null);
 
-  const processExcelFile = (file) => {
+  // Total record count, computed once per dataset instead of on every
+  // render of the status card
+  const totalRecordCount = useMemo(() => {
+    if (!uploadedData) return 0;
+    return Object.values(uploadedData).reduce(
+      (total, sheet) => total + (Array.isArray(sheet) ? sheet.length : 0),
+      0
+    );
+  }, [uploadedData]);
+
+  const yieldToEventLoop = () => new Promise(resolve => setTimeout(resolve, 0));
+
+  const parseWorkbook = async (buffer) => {
+    const data = new Uint8Array(buffer);
+    // Parse values only: skip formula text, HTML and formatted-text
+    // generation, and use dense sheet storage - we only read raw cell
+    // values in sheet_to_json below.
+    const workbook = XLSX.read(data, {
+      type: 'array',
+      dense: true,
+      cellDates: true,
+      cellFormula: false,
+      cellHTML: false,
+      cellText: false
+    });
+
+    const processedData = {};
+    let totalRecords = 0;
+
+    // Intern repeated cell strings so low-cardinality columns (statuses,
+    // locations, skills) keep one shared instance per distinct value
+    // instead of one per row. The pool lives only for this parse.
+    const internPool = new Map();
+    const intern = (value) => {
+      if (typeof value !== 'string' || value.length === 0) {
+        return value;
+      }
+      const shared = internPool.get(value);
+      if (shared !== undefined) {
+        return shared;
+      }
+      internPool.set(value, value);
+      return value;
+    };
+
+    // Process all sheets, yielding between them so the spinner keeps
+    // animating and the tab stays responsive on multi-sheet workbooks.
+    for (const sheetName of workbook.SheetNames) {
+      const worksheet = workbook.Sheets[sheetName];
+      const jsonData = XLSX.utils.sheet_to_json(worksheet, { header: 1 });
+
+      if (jsonData.length < 2) {
+        continue; // empty or header-only sheet - nothing to convert
+      }
+
+      const headers = jsonData[0];
+
+      // Phase 1: probe which columns actually carry data. Wide sheets
+      // often have unnamed or fully-empty trailing columns; skipping
+      // them here avoids per-row work for columns nobody can use.
+      const hasData = new Array(headers.length).fill(false);
+      for (let rowIndex = 1; rowIndex < jsonData.length; rowIndex++) {
+        const row = jsonData[rowIndex];
+        const limit = Math.min(row.length, headers.length);
+        for (let col = 0; col < limit; col++) {
+          if (!hasData[col] && row[col] !== undefined && row[col] !== '') {
+            hasData[col] = true;
+          }
+        }
+      }
+      const keptColumns = [];
+      for (let col = 0; col < headers.length; col++) {
+        const header = headers[col];
+        if (hasData[col] && header !== undefined && header !== null && header !== '') {
+          keptColumns.push(col);
+        }
+      }
+
+      if (keptColumns.length === 0) {
+        continue; // no named, data-bearing columns - skip the row pass
+      }
+
+      // Phase 2: convert rows to objects over the kept columns only.
+      // Only missing cells become '', so numeric 0 and false survive
+      // and stay typed for the dashboard.
+      const sheetData = [];
+      for (let rowIndex = 1; rowIndex < jsonData.length; rowIndex++) {
+        const row = jsonData[rowIndex];
+        if (!row.some(cell => cell !== undefined && cell !== '')) {
+          continue; // skip empty rows
+        }
+        const obj = {};
+        for (let k = 0; k < keptColumns.length; k++) {
+          const col = keptColumns[k];
+          const cell = row[col];
+          if (cell === undefined || cell === null) {
+            obj[headers[col]] = '';
+          } else if (cell instanceof Date) {
+            obj[headers[col]] = intern(formatDateCell(cell));
+          } else {
+            obj[headers[col]] = intern(cell);
+          }
+        }
+        sheetData.push(obj);
+      }
+
+      if (sheetData.length > 0) {
+        processedData[sheetName] = sheetData;
+        totalRecords += sheetData.length;
+      }
+
+      await yieldToEventLoop();
+    }
+
+    return { processedData, totalRecords };
+  };
+
+  const processExcelFile = async (file) => {
     setIsProcessing(true);
     setError(null);
 
-    const reader = new FileReader();
-    
-    reader.onload = (e) => {
-      try {
-        const data = new Uint8Array(e.target.result);
-        const workbook = XLSX.read(data, { type: 'array' });
-        
-        const processedData = {};
-        let totalRecords = 0;
-        
-        // Process all sheets
-        workbook.SheetNames.forEach((sheetName) => {
-          const worksheet = workbook.Sheets[sheetName];
-          const jsonData = XLSX.utils.sheet_to_json(worksheet, { header: 1 });
-          
-          if (jsonData.length > 0) {
-            // Convert to objects with headers
-            const headers = jsonData[0];
-            const rows = jsonData.slice(1);
-            
-            const sheetData = rows
-              .filter(row => row.some(cell => cell !== undefined && cell !== ''))
-              .map(row => {
-                const obj = {};
-                headers.forEach((header, index) => {
-                  obj[header] = row[index] || '';
-                });
-                return obj;
-              });
-            
-            processedData[sheetName] = sheetData;
-            totalRecords += sheetData.length;
+    try {
+      const identityKey = fileIdentityKey(file);
+      let result = identityCache.get(identityKey);
+
+      if (!result) {
+        const buffer = await file.arrayBuffer();
+        const cacheKey = await hashFileContent(buffer);
+
+        result = cacheKey ? parseCache.get(cacheKey) : null;
+        if (!result) {
+          result = await parseWorkbook(buffer);
+          if (cacheKey) {
+            rememberInCache(parseCache, cacheKey, result);
           }
-        });
-        
-        setFileInfo({
-          name: file.name,
-          size: file.size,
-          sheets: Object.keys(processedData).length,
-          records: totalRecords
-        });
-        
-        onDataUpload(processedData);
-        setIsProcessing(false);
-        
-      } catch (err) {
-        setError(`Error processing file: ${err.message}`);
-        setIsProcessing(false);
+        }
+        rememberInCache(identityCache, identityKey, result);
       }
-    };
-    
-    reader.onerror = () => {
-      setError('Error reading file');
+
+      setFileInfo({
+        name: file.name,
+        size: file.size,
+        sheets: Object.keys(result.processedData).length,
+        records: result.totalRecords
+      });
+
+      onDataUpload(result.processedData);
       setIsProcessing(false);
-    };
-    
-    reader.readAsArrayBuffer(file);
+
+    } catch (err) {
+      setError(`Error processing file: ${err.message}`);
+      setIsProcessing(false);
+    }
   };
 
   const handleFileSelect = (files) => {
@@ -210,7 +344,7 @@ function UploadTab({ onDataUpload, uploadedData, lastUploadTime, isSampleData })
               
               <div className="metrics-grid">
                 <div className="metric-card">
-                  <div className="metric-value">{Object.values(uploadedData).reduce((total, sheet) => total + (Array.isArray(sheet) ? sheet.length : 0), 0).toLocaleString()}</div>
+                  <div className="metric-value">{totalRecordCount.toLocaleString()}</div>
                   <div className="metric-label">Sample Records</div>
                 </div>
                 
@@ -275,13 +409,23 @@ function UploadTab({ onDataUpload, uploadedData, lastUploadTime, isSampleData })
               <button
                 className="button mt-1"
                 onClick={() => {
+                  // Preview only the first rows per sheet - stringifying the
+                  // full dataset can mean hundreds of MB for large workbooks.
+                  const PREVIEW_ROWS = 50;
+                  const preview = {};
+                  Object.entries(uploadedData).forEach(([sheetName, rows]) => {
+                    preview[sheetName] = Array.isArray(rows) ? rows.slice(0, PREVIEW_ROWS) : rows;
+                  });
                   const jsonWindow = window.open('', '_blank');
                   jsonWindow.document.write(`
                     <html>
                       <head><title>JSON Data Preview</title></head>
                       <body>
+                        <p style="font-family: sans-serif; padding: 0 20px;">
+                          Showing up to ${PREVIEW_ROWS} rows per sheet. Use the Data Table tab to download the full dataset.
+                        </p>
                         <pre style="font-family: monospace; padding: 20px;">
-                          ${JSON.stringify(uploadedData, null, 2)}
+                          ${JSON.stringify(preview, null, 2)}
                         </pre>
                       </body>
                     </html>
@@ -0,0 +1,18 @@
+// Column-name keyword matching for the dashboard.
+//
+// Chart and KPI builders look up "the competency-ish column" by running a
+// chain of toLowerCase().includes() checks against every column name. Each
+// keyword group is compiled once into a single case-insensitive regex so a
+// lookup is one test per column name.
+
+const escapeRegExp = (text) => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+export const compileKeywordPattern = (keywords) =>
+  new RegExp(keywords.map(escapeRegExp).join('|'), 'i');
+
+// Returns the first column whose name matches the pattern, or the fallback
+// when none does.
+export const findColumnByKeywords = (columns, pattern, fallback) => {
+  const match = columns.find(column => pattern.test(column));
+  return match !== undefined ? match : fallback;
+};
@@ -0,0 +1,267 @@
+// Columnar view cache for uploaded sheets.
+//
+// Sheets are stored as arrays of row objects (one object per row), which is
+// convenient for rendering but wasteful to rescan column by column. This
+// module lazily builds an array-per-column view of a sheet and caches it
+// against the row array itself, so tab switches and re-renders reuse the
+// same view instead of walking every row object again. Entries are released
+// automatically when the sheet data is replaced (WeakMap keying).
+
+const viewCache = new WeakMap();
+
+const EMPTY_VIEW = { columns: [], columnValues: {}, rowCount: 0 };
+
+export const getColumnarView = (rows) => {
+  if (!Array.isArray(rows) || rows.length === 0) {
+    return EMPTY_VIEW;
+  }
+
+  let view = viewCache.get(rows);
+  if (!view) {
+    const columns = Object.keys(rows[0]);
+    const columnValues = {};
+
+    columns.forEach(column => {
+      const values = new Array(rows.length);
+      for (let i = 0; i < rows.length; i++) {
+        values[i] = rows[i][column];
+      }
+      columnValues[column] = values;
+    });
+
+    view = { columns, columnValues, rowCount: rows.length };
+    viewCache.set(rows, view);
+  }
+
+  return view;
+};
+
+// Unified lowercase search index: one concatenated string per row, built
+// lazily on the first search against a sheet and cached for its lifetime.
+// Matching a search term is then a single includes() over one flat array
+// instead of one probe per column, and sheets the user never searches
+// never pay the stringify cost.
+const searchIndexCache = new WeakMap();
+
+export const getSearchIndex = (rows) => {
+  if (!Array.isArray(rows) || rows.length === 0) {
+    return [];
+  }
+
+  let index = searchIndexCache.get(rows);
+  if (!index) {
+    const { columns, columnValues, rowCount } = getColumnarView(rows);
+    index = new Array(rowCount);
+    const parts = new Array(columns.length);
+
+    for (let i = 0; i < rowCount; i++) {
+      for (let c = 0; c < columns.length; c++) {
+        const value = columnValues[columns[c]][i];
+        parts[c] = value === undefined || value === null ? '' : value.toString();
+      }
+      index[i] = parts.join('|').toLowerCase();
+    }
+    searchIndexCache.set(rows, index);
+  }
+
+  return index;
+};
+
+// Numeric/categorical column classification is an O(rows x cols) scan, so
+// cache it per sheet alongside the columnar view. The scan itself is kept
+// as tight indexed loops over hoisted predicates - the closest a browser
+// gets to a compiled aggregation kernel is giving the JIT monomorphic
+// loops with a typeof fast path.
+const classificationCache = new WeakMap();
+
+const EMPTY_CLASSIFICATION = { numericColumns: [], categoricalColumns: [] };
+
+const isNumericValue = (value) => {
+  if (typeof value === 'number') {
+    return isFinite(value);
+  }
+  return !isNaN(parseFloat(value)) && isFinite(value);
+};
+
+// Classification is a representativeness question, not an exact one: a
+// bounded sample is enough to decide whether a column is numeric or
+// carries data, and it keeps classification cost independent of sheet
+// size on very tall sheets.
+const CLASSIFY_SAMPLE_ROWS = 10000;
+
+const hasNumericValue = (values) => {
+  const limit = Math.min(values.length, CLASSIFY_SAMPLE_ROWS);
+  for (let i = 0; i < limit; i++) {
+    if (isNumericValue(values[i])) return true;
+  }
+  return false;
+};
+
+const hasNonBlankValue = (values) => {
+  const limit = Math.min(values.length, CLASSIFY_SAMPLE_ROWS);
+  for (let i = 0; i < limit; i++) {
+    const value = values[i];
+    if (value && value.toString().trim()) return true;
+  }
+  return false;
+};
+
+// Per-column value counts (trimmed, non-blank values), cached per sheet
+// and per column. This is the aggregation kernel behind the distribution
+// charts: a tight indexed loop over the columnar view, run once per
+// column no matter how many charts consume the result. Counts are kept
+// in a Map - hashed lookups stay fast at high cardinality and cell text
+// like '__proto__' can't collide with object prototype keys.
+const valueCountsCache = new WeakMap();
+
+export const getValueCounts = (rows, column) => {
+  if (!Array.isArray(rows) || rows.length === 0) {
+    return new Map();
+  }
+
+  let perColumn = valueCountsCache.get(rows);
+  if (!perColumn) {
+    perColumn = new Map();
+    valueCountsCache.set(rows, perColumn);
+  }
+
+  let counts = perColumn.get(column);
+  if (!counts) {
+    counts = new Map();
+    const values = getColumnarView(rows).columnValues[column];
+    if (values) {
+      // Cell strings are interned at upload, so a column holds few
+      // distinct instances. Normalize each distinct raw value once and
+      // reuse it through this map - per-cell work collapses to a hashed
+      // lookup, the JS equivalent of counting categorical codes.
+      const normalized = new Map();
+      for (let i = 0; i < values.length; i++) {
+        const raw = values[i];
+        if (raw === undefined || raw === null || raw === '') {
+          continue;
+        }
+        let value = normalized.get(raw);
+        if (value === undefined) {
+          value = raw.toString().trim();
+          normalized.set(raw, value);
+        }
+        if (value) {
+          counts.set(value, (counts.get(value) || 0) + 1);
+        }
+      }
+    }
+    perColumn.set(column, counts);
+  }
+
+  return counts;
+};
+
+// Distinct-count reduction for the KPI tiles. When the full value-counts
+// Map for a column is already cached (the chart builders usually get
+// there first) this is just a .size read; otherwise it counts distinct
+// trimmed values with a Set in a single pass, without materializing the
+// per-value counts a KPI never looks at.
+const distinctCountCache = new WeakMap();
+
+export const getDistinctCount = (rows, column) => {
+  if (!Array.isArray(rows) || rows.length === 0) {
+    return 0;
+  }
+
+  const perColumnCounts = valueCountsCache.get(rows);
+  const counts = perColumnCounts && perColumnCounts.get(column);
+  if (counts) {
+    return counts.size;
+  }
+
+  let perColumn = distinctCountCache.get(rows);
+  if (!perColumn) {
+    perColumn = new Map();
+    distinctCountCache.set(rows, perColumn);
+  }
+
+  let count = perColumn.get(column);
+  if (count === undefined) {
+    const values = getColumnarView(rows).columnValues[column];
+    const distinct = new Set();
+    if (values) {
+      // Distinct raw values, not cells, pay the trim: different raws can
+      // trim to the same value, so the trimmed set gives the real count
+      const seen = new Set();
+      for (let i = 0; i < values.length; i++) {
+        const raw = values[i];
+        if (raw === undefined || raw === null || raw === '' || seen.has(raw)) {
+          continue;
+        }
+        seen.add(raw);
+        const value = raw.toString().trim();
+        if (value) {
+          distinct.add(value);
+        }
+      }
+    }
+    count = distinct.size;
+    perColumn.set(column, count);
+  }
+
+  return count;
+};
+
+// Fused "top-K of a column" kernel shared by every chart builder: reads
+// the cached value counts and keeps a small sorted window in a single
+// bounded-selection pass, optionally rolling the tail into an 'Other'
+// bucket so the chart still represents every row.
+export const getTopCounts = (rows, column, limit, { withOther = false } = {}) => {
+  const counts = getValueCounts(rows, column);
+  const top = [];
+  let total = 0;
+
+  for (const [key, value] of counts) {
+    total += value;
+
+    if (top.length < limit || value > top[top.length - 1][1]) {
+      let i = top.length;
+      while (i > 0 && top[i - 1][1] < value) {
+        i--;
+      }
+      top.splice(i, 0, [key, value]);
+      if (top.length > limit) {
+        top.pop();
+      }
+    }
+  }
+
+  if (withOther) {
+    let topTotal = 0;
+    for (let i = 0; i < top.length; i++) {
+      topTotal += top[i][1];
+    }
+    if (topTotal < total) {
+      top.push(['Other', total - topTotal]);
+    }
+  }
+
+  return top;
+};
+
+export const classifyColumns = (rows) => {
+  if (!Array.isArray(rows) || rows.length === 0) {
+    return EMPTY_CLASSIFICATION;
+  }
+
+  let classification = classificationCache.get(rows);
+  if (!classification) {
+    const { columns, columnValues } = getColumnarView(rows);
+
+    const numericColumns = columns.filter(column => hasNumericValue(columnValues[column]));
+    const numericSet = new Set(numericColumns);
+    const categoricalColumns = columns.filter(column =>
+      !numericSet.has(column) && hasNonBlankValue(columnValues[column])
+    );
+
+    classification = { numericColumns, categoricalColumns };
+    classificationCache.set(rows, classification);
+  }
+
+  return classification;
+};
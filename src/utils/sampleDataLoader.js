@@ -1,7 +1,23 @@
 import * as XLSX from 'xlsx';
 
-// Sample data loader utility
-export const loadSampleData = async () => {
+// Sample data loader utility. The fetch+parse is memoized so remounts
+// (including React strict-mode double effects) reuse one in-flight or
+// completed load instead of re-parsing the workbook.
+let sampleDataPromise = null;
+
+export const loadSampleData = () => {
+  if (!sampleDataPromise) {
+    sampleDataPromise = fetchSampleData().then(result => {
+      if (result === null) {
+        sampleDataPromise = null; // allow a retry after a failed load
+      }
+      return result;
+    });
+  }
+  return sampleDataPromise;
+};
+
+const fetchSampleData = async () => {
   try {
     // Fetch the sample Excel file from attached_assets
     const response = await fetch('/attached_assets/AEM (1)_1755355780712.xlsx');